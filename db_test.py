@@ -1,6 +1,7 @@
 from lambdamoo_db import exporter
-from lambdamoo_db.reader import load
+from lambdamoo_db.reader import Reader, load
 import cattrs
+import pytest
 
 
 def test_lambda() -> None:
@@ -31,3 +32,65 @@ def test_toast2() -> None:
 
     with open("toast2.json", "w") as f:
         exporter.to_json_file(cattrs.unstructure(db), f, indent=2)
+
+
+def test_read_value_none_key() -> None:
+    r = Reader(["10", "2", "5", "0", "5", "0", "5", "2", "x"])
+    assert r.readValue(None) == {None: 5, 5: "x"}
+    assert r.pos == 9
+
+
+def test_read_value_nested() -> None:
+    r = Reader(["10", "2", "2", "a", "4", "2", "0", "1", "2", "b", "0", "3", "10", "0", "4", "0", "2", "z"])
+    assert r.readValue(None) == {"a": [1, "b"], 3: {}}
+    assert r.readValue(None) == []
+    assert r.readValue(None) == "z"
+
+
+def test_read_value_deep_nesting() -> None:
+    depth = 5000
+    value = Reader(["4", "1"] * depth + ["2", "x"]).readValue(None)
+    for _ in range(depth):
+        assert isinstance(value, list) and len(value) == 1
+        value = value[0]
+    assert value == "x"
+
+
+def test_activation_debug_flag() -> None:
+    prelude = ["0", "0", "1", "2", "1", "1", "0"]
+    trailer = ["No", "More", "Parse", "Infos", "verb", "verbname"]
+    r = Reader(prelude + ["2 -7 -8 3 -9 4 5 -10 0"] + trailer)
+    activation = r.read_activation_as_pi(None)
+    assert activation.debug is False
+    assert (activation.this, activation.player, activation.programmer, activation.vloc) == (2, 3, 4, 5)
+    assert activation.threaded == 0
+    assert activation.verbname == "verbname"
+
+    r = Reader(prelude + ["2 -7 -8 3 -9 4 5 -10 1"] + trailer)
+    assert r.read_activation_as_pi(None).debug is True
+
+
+def test_object_header_errors() -> None:
+    assert Reader(["#12"]).readObjectHeader() == 12
+    assert Reader(["#12 recycled"]).readObjectHeader() is None
+    with pytest.raises(Exception, match="Parse Error.*bad object number") as excinfo:
+        Reader(["#12x"]).readObjectHeader()
+    assert excinfo.type is Exception
+
+
+def test_code_block_terminator() -> None:
+    r = Reader(["return 1;", "return 2;", ".", "next"])
+    assert r.readCode() == ["return 1;", "return 2;"]
+    assert r.readString() == "next"
+    with pytest.raises(Exception, match="Parse Error.*unterminated code block") as excinfo:
+        Reader(["return 1;", "return 2;"]).readCode()
+    assert excinfo.type is Exception
+
+
+def test_read_bool() -> None:
+    r = Reader(["1", "0"])
+    assert r.readBool() is True
+    assert r.readBool() is False
+    for line in ["", "x", "2"]:
+        with pytest.raises(Exception, match="Parse Error.*bad boolean"):
+            Reader([line]).readBool()
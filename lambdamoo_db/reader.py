@@ -16,16 +16,15 @@ from .database import (
 )
 from typing import Any, NoReturn, Pattern, Union
 import parse
-import re
-from io import TextIOWrapper
 from logging import getLogger
 logger = getLogger(__name__)
 
 
 def load(filename: str) -> MooDatabase:
-    with open(filename, "r", encoding="latin-1") as f:
-        r = Reader(f, filename)
-        return r.parse()
+    with open(filename, "rb") as f:
+        data = f.read().decode("latin-1")
+    r = Reader(data, filename)
+    return r.parse()
 
 
 def compile(template: str) -> Pattern[str]:
@@ -36,32 +35,61 @@ def compile(template: str) -> Pattern[str]:
 
 
 versionRe = compile(templates.version)
-varCountRe = compile(templates.var_count)
-clockCountRe = compile(templates.clock_count)
-taskCountRe = compile(templates.task_count)
-taskHeaderRe = compile(templates.task_header)
-activationHeaderRe = compile(templates.activation_header)
-pendingValueRe = compile(templates.pending_values_count)
-suspendedTaskCountRe = compile(templates.suspended_task_count)
 suspendedTaskHeaderRe = compile(templates.suspended_task_header)
-interruptedTaskCountRe = compile(templates.interrupted_task_count)
-interruptedTaskHeaderRe = re.compile(r"(?P<id>\d+) (?P<status>[\w\W]+)")
-vmHeaderRe = compile(templates.vm_header)
-connectionCountRe = re.compile(r"(?P<count>\d+) active connections(?P<listener_tag>| with listeners)")
 langverRe = compile(templates.langver)
 stackheaderRe = compile(templates.stack_header)
 pcRe = compile(templates.pc)
 waifHeaderRe = compile(templates.waif_header)
 
+# Plain int copies of the hottest MooTypes, so readValue compares ints rather than enum members
+STR = int(MooTypes.STR)
+INT = int(MooTypes.INT)
+OBJ = int(MooTypes.OBJ)
+CLEAR = int(MooTypes.CLEAR)
+LIST = int(MooTypes.LIST)
+MAP = int(MooTypes.MAP)
+
+# Key-slot markers for Reader.readValue frames: a list frame, and a map frame waiting for its next key
+_LIST_FRAME = object()
+_NO_KEY = object()
+
 
 class Reader:
-    def __init__(self, fio: TextIOWrapper, filename: str = "") -> None:
+    def __init__(self, data: str | list[str], filename: str = "") -> None:
         self.filename = filename
-        self.file = fio
-        self.line = 0
+        if isinstance(data, str):
+            if "\r" in data:
+                data = data.replace("\r\n", "\n").replace("\r", "\n")
+            data = data.split("\n")
+        self.lines = data
+        self.pos = 0
+        # readValue dispatch, split by whether the reader needs the database
+        self.scalar_readers = {
+            MooTypes.STR: self.readString,
+            MooTypes.OBJ: self.readObjnum,
+            MooTypes.INT: self.readInt,
+            MooTypes.FLOAT: self.readFloat,
+            MooTypes.ERR: self.readErr,
+            MooTypes.BOOL: self.readBool,
+            MooTypes._CATCH: self.readInt,
+            MooTypes._FINALLY: self.readInt,
+        }
+        self.db_readers = {
+            MooTypes.ANON: self.readAnon,
+            MooTypes.WAIF: self.readWaif,
+        }
+        self.selectReaders(DBVersions.Num_DB_Versions - 1)
+
+    def selectReaders(self, version: int) -> None:
+        """Pick the version-specific readers once rather than branching per object/activation"""
+        self.readObject = self.readObject_v4 if version == 4 else self.readObject_ng
+        if version >= DBVersions.DBV_Threaded:
+            self.read_activation_prelude = self.read_activation_prelude_threaded
+        else:
+            self.read_activation_prelude = self.read_activation_prelude_old
 
     def parse_error(self, message: str) -> NoReturn:
-        raise Exception(f"Parse Error: {self.filename}:{self.line} : {message}")
+        raise Exception(f"Parse Error: {self.filename}:{self.pos} : {message}")
 
     def parse(self) -> "MooDatabase":
         db = MooDatabase()
@@ -71,6 +99,7 @@ class Reader:
         if not version:
             self.parse_error("Invalid version string")
         db.version = int(version.group("version"))
+        self.selectReaders(db.version)
         match db.version:
             case 4:
                 self.parse_v4(db)
@@ -84,7 +113,7 @@ class Reader:
         logger.debug("Parsing v4 database")
         db.total_objects = self.readInt()
         db.total_verbs = self.readInt()
-        self.readString()  # dummy
+        self.skip()  # dummy
         self.readPlayers(db)
         self.readObjects(db)
         self.readVerbs(db)
@@ -111,50 +140,107 @@ class Reader:
         self.readVerbs(db)
 
     def readValue(self, db: MooDatabase, *, known_type: int | None = None) -> Any:
-        if known_type is not None:
-            val_type = known_type
-        else:
-            val_type = self.readInt()
-        match val_type:
-            case MooTypes.STR:
-                return self.readString()
-            case MooTypes.OBJ:
-                return self.readObjnum()
-            case MooTypes.ANON:
-                return self.readAnon(db)
-            case MooTypes.INT:
-                return self.readInt()
-            case MooTypes.FLOAT:
-                return self.readFloat()
-            case MooTypes.ERR:
-                return self.readErr()
-            case MooTypes.LIST:
-                return self.readList(db)
-            case MooTypes.CLEAR:
-                pass
-            case MooTypes.NONE:
-                pass
-            case MooTypes.MAP:
-                return self.readMap(db)
-            case MooTypes.BOOL:
-                return self.readBool()
-            case MooTypes._CATCH:
-                return self.readInt()
-            case MooTypes._FINALLY:
-                return self.readInt()
-            case MooTypes.WAIF:
-                return self.readWaif(db)
-            case _:
-                self.parse_error(f"unknown type {val_type}")
+        """Read a value, walking nested lists and maps with an explicit stack rather than recursion"""
+        lines = self.lines
+        # Each frame is [container, remaining items, pending map key or _LIST_FRAME]
+        stack: list[list[Any]] = []
+        while True:
+            i = self.pos
+            if known_type is not None:
+                val_type = known_type
+                known_type = None
+            else:
+                val_type = int(lines[i])
+                i += 1
+            # Inline the most common types; everything else goes through the dispatch tables
+            if val_type == STR:
+                self.pos = i + 1
+                value = lines[i]
+            elif val_type == LIST:
+                self.pos = i + 1
+                length = int(lines[i])
+                if length:
+                    stack.append([[None] * length, length, _LIST_FRAME])
+                    continue
+                value = []
+            elif val_type == INT:
+                self.pos = i + 1
+                value = int(lines[i])
+            elif val_type == OBJ:
+                self.pos = i + 1
+                value = ObjNum(lines[i])
+            elif val_type == MAP:
+                self.pos = i + 1
+                items = int(lines[i])
+                if items:
+                    stack.append([{}, items, _NO_KEY])
+                    continue
+                value = {}
+            else:
+                self.pos = i
+                if val_type == CLEAR:
+                    value = None
+                elif (reader := self.scalar_readers.get(val_type)) is not None:
+                    value = reader()
+                elif (reader := self.db_readers.get(val_type)) is not None:
+                    value = reader(db)
+                elif val_type == MooTypes.NONE:
+                    value = None
+                else:
+                    self.parse_error(f"unknown type {val_type}")
+
+            # Attach the value to the innermost open container, closing any that are now full
+            while stack:
+                frame = stack[-1]
+                container = frame[0]
+                if frame[2] is _LIST_FRAME:
+                    container[len(container) - frame[1]] = value
+                elif frame[2] is _NO_KEY:
+                    frame[2] = value
+                    break
+                else:
+                    container[frame[2]] = value
+                    frame[2] = _NO_KEY
+                frame[1] -= 1
+                if frame[1]:
+                    break
+                stack.pop()
+                value = container
+            else:
+                return value
+
+    def readCount(self, *suffixes: str) -> int | None:
+        """Read a "<count> <suffix>" header line, returning None if it doesn't match"""
+        count, _, rest = self.readString().partition(" ")
+        if rest not in suffixes or not count.isdecimal():
+            return None
+        return int(count)
+
+    def readIntFields(self, count: int, message: str) -> list[int]:
+        """Read a line of `count` space-separated integers"""
+        parts = self.readString().split()
+        if len(parts) != count:
+            self.parse_error(message)
+        try:
+            return [int(p) for p in parts]
+        except ValueError:
+            self.parse_error(message)
+
+    def skip(self, count: int = 1) -> None:
+        """Advance past `count` lines without reading them"""
+        self.pos += count
 
     def readString(self) -> str:
         """Read a string from the database file"""
-        self.line += 1
-        return self.file.readline().rstrip("\r\n")
+        s = self.lines[self.pos]
+        self.pos += 1
+        return s
 
     def readInt(self) -> int:
         """Read an integer from the database file"""
-        return int(self.readString())
+        i = self.pos
+        self.pos = i + 1
+        return int(self.lines[i])
 
     def readErr(self) -> int:
         return self.readInt()
@@ -163,27 +249,17 @@ class Reader:
         return float(self.readString())
 
     def readObjnum(self) -> ObjNum:
-        return ObjNum(self.readString())
+        i = self.pos
+        self.pos = i + 1
+        return ObjNum(self.lines[i])
 
     def readBool(self) -> bool:
-        return bool(self.readInt())
-
-    def readList(self, db: MooDatabase) -> list[Any]:
-        length = self.readInt()
-        result = []
-        for _ in range(length):
-            result.append(self.readValue(db))
-        return result
-
-    def readMap(self, db: MooDatabase) -> dict:
-        # self.parse_error(f'MAP @ Line {self.line}')
-        items = self.readInt()
-        map = {}
-        for _ in range(items):
-            key = self.readValue(db)
-            val = self.readValue(db)
-            map[key] = val
-        return map
+        s = self.readString()
+        if s == "1":
+            return True
+        if s == "0":
+            return False
+        self.parse_error(f"bad boolean {s!r}")
 
     def readWaif(self, db: MooDatabase):
         #  waif.cc:950 read_waif()
@@ -208,18 +284,26 @@ class Reader:
         _terminator = self.readString()
         return WaifReference(index)
 
-    def readObject_v4(self, db: MooDatabase) -> Union[MooObject, None]:
+    def readObjectHeader(self) -> int | None:
+        """Read a "#<num>" object header, returning None for recycled objects"""
         objNumber = self.readString()
-        if not objNumber.startswith("#"):
+        if objNumber[:1] != "#":
             self.parse_error("object number does not have #")
+        try:
+            return int(objNumber[1:])
+        except ValueError:
+            if "recycled" in objNumber:
+                logger.debug(f"Skipping recycled object {objNumber}")
+                return None
+            self.parse_error(f"bad object number {objNumber}")
 
-        if "recycled" in objNumber:
-            logger.debug(f"Skipping recycled object {objNumber}")
+    def readObject_v4(self, db: MooDatabase) -> Union[MooObject, None]:
+        oid = self.readObjectHeader()
+        if oid is None:
             return None
 
-        oid = int(objNumber[1:])
         name = self.readString()
-        self.readString()  # blankline
+        self.skip()  # blankline
         flags = self.readInt()
         owner = self.readObjnum()
         location = self.readObjnum()
@@ -245,15 +329,10 @@ class Reader:
         return obj
 
     def readObject_ng(self, db: MooDatabase) -> Union[MooObject, None]:
-        objNumber = self.readString()
-        if not objNumber.startswith("#"):
-            self.parse_error("object number does not have #")
-
-        if "recycled" in objNumber:
-            logger.debug(f"Skipping recycled object {objNumber}")
+        oid = self.readObjectHeader()
+        if oid is None:
             return None
 
-        oid = int(objNumber[1:])
         name = self.readString()
         flags = self.readInt()
         owner = self.readObjnum()
@@ -283,20 +362,18 @@ class Reader:
             return Anon(oid)
 
     def readConnections(self) -> None:
-        header = self.readString()
-        headerMatch = connectionCountRe.match(header)
-        if not headerMatch:
+        count = self.readCount("active connections", "active connections with listeners")
+        if count is None:
             self.parse_error("Bad active connections header line")
 
-        count = int(headerMatch.group("count"))
-        for _ in range(count):
-            # Read and discard `count` lines; this data is useless to us.
-            self.readString()
+        # Skip `count` lines; this data is useless to us.
+        self.skip(count)
 
     def readVerbs(self, db: MooDatabase) -> None:
         logger.debug(f"Reading {db.total_verbs} verbs")
+        readVerb = self.readVerb
         for _ in range(db.total_verbs):
-            self.readVerb(db)
+            readVerb(db)
         logger.debug(f"Finished reading {db.total_verbs} verbs")
 
     def readVerb(self, db: MooDatabase) -> None:
@@ -320,19 +397,20 @@ class Reader:
         verb.code = code
 
     def readCode(self) -> list[str]:
-        code = []
-        lastLine = self.readString()
-        while lastLine != ".":
-            code.append(lastLine)
-            lastLine = self.readString()
+        try:
+            end = self.lines.index(".", self.pos)
+        except ValueError:
+            self.parse_error("unterminated code block")
+        code = self.lines[self.pos:end]
+        self.pos = end + 1
         return code
 
     def readPlayers(self, db: MooDatabase) -> None:
         db.total_players = self.readInt()
         logger.debug(f"Reading {db.total_players} players")
-        db.players = []
-        for _ in range(db.total_players):
-            db.players.append(self.readObjnum())
+        end = self.pos + db.total_players
+        db.players = list(map(ObjNum, self.lines[self.pos:end]))
+        self.pos = end
         assert db.total_players == len(db.players)
         logger.debug(f"Finished reading {db.total_players} players")
 
@@ -344,15 +422,10 @@ class Reader:
             db.objects[obj.id] = obj
 
     def readObjects(self, db: MooDatabase) -> None:
-        db.objects = {}
-        for _ in range(db.total_objects):
-            if db.version == 4:
-                obj = self.readObject_v4(db)
-            else:
-                obj = self.readObject_ng(db)
-            if not obj:
-                continue
-            db.objects[obj.id] = obj
+        readObject = self.readObject
+        objects = [readObject(db) for _ in range(db.total_objects)]
+        # Recycled objects are read as None
+        db.objects = {obj.id: obj for obj in objects if obj is not None}
         for o in db.objects.values():
             self.process_propnames(db, o)
 
@@ -365,17 +438,12 @@ class Reader:
                 # todo: Identify order of multi-inheritence
                 break
             parent = db.objects.get(parent.parent)
-        i = 1
-        for p in obj.properties:
-            try:
-                n = names.pop(0)
-            except IndexError:
-                n = i
+        for i, p in enumerate(obj.properties):
+            n = names[i] if i < len(names) else i + 1
             if not p.propertyName:
                 p.propertyName = n
             elif n != p.propertyName:
                 self.parse_error(f"property name mismatch: {n} != {p.propertyName}")
-            i += 1
 
     def readVerbMetadata(self, obj: MooObject) -> None:
         name = self.readString()
@@ -386,38 +454,35 @@ class Reader:
         obj.verbs.append(verb)
 
     def readProperties(self, db: MooDatabase, obj: MooObject):
-        numProperties = self.readInt()
-        propertyNames = []
-        for _ in range(numProperties):
-            propertyNames.append(self.readString())
-        numPropdefs = self.readInt()
-        for _ in range(numPropdefs):
-            propertyName = None
-            if propertyNames:
-                propertyName = propertyNames.pop(0)
-            value = self.readValue(db)
-            owner = self.readObjnum()
-            perms = PropertyFlags(self.readInt())
+        readInt = self.readInt
+        readString = self.readString
+        readValue = self.readValue
+        readObjnum = self.readObjnum
+        properties = obj.properties
+        numProperties = readInt()
+        propertyNames = [readString() for _ in range(numProperties)]
+        numPropdefs = readInt()
+        for i in range(numPropdefs):
+            propertyName = propertyNames[i] if i < numProperties else None
+            value = readValue(db)
+            owner = readObjnum()
+            perms = PropertyFlags(readInt())
             property = Property(propertyName, value, owner, perms)
-            obj.properties.append(property)
+            properties.append(property)
 
     def readPending(self, db: MooDatabase) -> None:
-        valueLine = self.readString()
-        valueMatch = pendingValueRe.match(valueLine)
-        if not valueMatch:
+        finalizationCount = self.readCount("values pending finalization")
+        if finalizationCount is None:
             self.parse_error("Bad pending finalizations")
 
-        finalizationCount = int(valueMatch.group("count"))
         for _ in range(finalizationCount):
             self.readValue(db)
 
     def readClocks(self, db: MooDatabase) -> None:
-        clockLine = self.readString()
-        clockMatch = clockCountRe.match(clockLine)
-        if not clockMatch:
+        numClocks = self.readCount("clocks")
+        if numClocks is None:
             self.parse_error("Could not find clock definitions")
         db.clocks = []
-        numClocks = int(clockMatch.group("count"))
         for _ in range(numClocks):
             self.readClock(db)
 
@@ -426,67 +491,58 @@ class Reader:
         db.clocks.append(self.readString())
 
     def readTaskQueue(self, db: MooDatabase) -> None:
-        queuedTasksLine = self.readString()
-        queuedTasksMatch = taskCountRe.match(queuedTasksLine)
-        if not queuedTasksMatch:
+        numTasks = self.readCount("queued tasks")
+        if numTasks is None:
             self.parse_error("Could not find task queue")
 
-        numTasks = int(queuedTasksMatch.group("count"))
         logger.debug(f"Reading {numTasks} queued tasks")
-        db.queuedTasks = []
-        for _ in range(numTasks):
-            self.readQueuedTask(db)
+        readQueuedTask = self.readQueuedTask
+        db.queuedTasks = [readQueuedTask(db) for _ in range(numTasks)]
         assert numTasks == len(db.queuedTasks)
         logger.debug(f"Finished reading {numTasks} queued tasks")
 
-    def readQueuedTask(self, db: MooDatabase) -> None:
-        headerLine = self.readString()
-        headerMatch = taskHeaderRe.match(headerLine)
-        if not headerMatch:
-            self.parse_error("Could not find task header")
-        unused = int(headerMatch[1])
-        firstLineno = int(headerMatch[2])
-        st = int(headerMatch[3])
-        id = int(headerMatch[4])
+    def readQueuedTask(self, db: MooDatabase) -> QueuedTask:
+        unused, firstLineno, st, id = self.readIntFields(4, "Could not find task header")
         task = QueuedTask(firstLineno, id, st)
         activation = self.read_activation_as_pi(db)
         task.activation = activation
         task.rtEnv = self.readRTEnv(db)
         task.code = self.readCode()
         task.unused = unused
-        db.queuedTasks.append(task)
+        return task
 
-    def read_activation_as_pi(self, db: MooDatabase) -> Activation:
+    def read_activation_prelude_threaded(self, db: MooDatabase) -> int:
+        """Read the values preceding an activation header for DBV_Threaded and later, returning the threaded flag"""
+        _ = self.readValue(db)
+        _this = self.readValue(db)
+        _vloc = self.readValue(db)
+        return self.readInt()
+
+    def read_activation_prelude_old(self, db: MooDatabase) -> int:
+        """Read the values preceding an activation header for versions before DBV_Threaded"""
         _ = self.readValue(db)
         if db.version >= DBVersions.DBV_This:
             _this = self.readValue(db)
         if db.version >= DBVersions.DBV_Anon:
             _vloc = self.readValue(db)
-        if db.version >= DBVersions.DBV_Threaded:
-            threaded = self.readInt()
-        else:
-            threaded = 0
+        return 0
 
-        headerLine = self.readString()
-        headerMatch = activationHeaderRe.match(headerLine)
-        if not headerMatch:  # or headerMatch.length !== 6) {
-            self.parse_error("Could not find activation header")
+    def read_activation_as_pi(self, db: MooDatabase) -> Activation:
+        threaded = self.read_activation_prelude(db)
+        header = self.readIntFields(9, "Could not find activation header")
 
         activation = Activation()
-        activation.this = int(headerMatch[1])
-        activation.unused1 = int(headerMatch[2])
+        activation.this = header[0]
+        activation.unused1 = header[1]
         activation.threaded = threaded
-        activation.unused2 = int(headerMatch[3])
-        activation.player = int(headerMatch[4])
-        activation.unused3 = int(headerMatch[5])
-        activation.programmer = int(headerMatch[6])
-        activation.vloc = int(headerMatch[7])
-        activation.unused4 = int(headerMatch[8])
-        activation.debug = bool(headerMatch[9])
-        self.readString()  # /* Was argstr*/
-        self.readString()  # /* Was dobjstr*/
-        self.readString()  # /* Was prepstr*/
-        self.readString()  # /* Was iobjstr*/
+        activation.unused2 = header[2]
+        activation.player = header[3]
+        activation.unused3 = header[4]
+        activation.programmer = header[5]
+        activation.vloc = header[6]
+        activation.unused4 = header[7]
+        activation.debug = bool(header[8])
+        self.skip(4)  # /* Was argstr, dobjstr, prepstr, iobjstr */
         activation.verb = self.readString()
         activation.verbname = self.readString()
         return activation
@@ -505,10 +561,8 @@ class Reader:
         stackheaderMatch = stackheaderRe.match(stackheader)
         if not stackheaderMatch:
             self.parse_error("READ_ACTIV: bad stack header")
-        stack = []
-        for _ in range(int(stackheaderMatch.group("slots"))):
-            _s = self.readValue(db)
-            stack.append(_s)
+        readValue = self.readValue
+        stack = [readValue(db) for _ in range(int(stackheaderMatch.group("slots")))]
         activation = self.read_activation_as_pi(db)
         activation.stack = stack
         activation.code = code
@@ -522,32 +576,28 @@ class Reader:
         return activation
 
     def readRTEnv(self, db: MooDatabase) -> dict[str, Any]:
-        varCountLine = self.readString()
-        varCountMatch = varCountRe.match(varCountLine)
-        if not varCountMatch:
+        varCount = self.readCount("variables")
+        if varCount is None:
             self.parse_error("Could not find variable count for RT Env")
 
-        varCount = int(varCountMatch.group("count"))
         logger.debug(f"Reading RTEnv with {varCount} variables")
         rtEnv = {}
+        lines = self.lines
+        readValue = self.readValue
         for _ in range(varCount):
-            name = self.readString()
-            value = self.readValue(db)
-            rtEnv[name] = value
+            i = self.pos
+            self.pos = i + 1
+            rtEnv[lines[i]] = readValue(db)
         return rtEnv
 
     def readSuspendedTasks(self, db: MooDatabase) -> None:
-        valueLine = self.readString()
-        suspendedMatch = suspendedTaskCountRe.match(valueLine)
-        if not suspendedMatch:
+        count = self.readCount("suspended tasks")
+        if count is None:
             self.parse_error("Bad suspended tasks header")
 
-        db.suspendedTasks = []
-        count = int(suspendedMatch.group("count"))
-        for _ in range(count):
-            self.readSuspendedTask(db)
+        db.suspendedTasks = [self.readSuspendedTask(db) for _ in range(count)]
 
-    def readSuspendedTask(self, db: MooDatabase) -> None:
+    def readSuspendedTask(self, db: MooDatabase) -> SuspendedTask:
         headerLine = self.readString()
         taskMatch = suspendedTaskHeaderRe.match(headerLine)
         if not taskMatch:
@@ -559,24 +609,20 @@ class Reader:
         if val := taskMatch.group("value"):
             task.value = self.readValue(db, known_type=int(val))
         task.vm = self.readVM(db)
-        db.suspendedTasks.append(task)
+        return task
 
     def readInterruptedTasks(self, db: MooDatabase):
-        valueLine = self.readString()
-        interruptedMatch = interruptedTaskCountRe.match(valueLine)
-        if not interruptedMatch:
+        count = self.readCount("interrupted tasks")
+        if count is None:
             self.parse_error("Bad suspended tasks header")
 
-        count = int(interruptedMatch.group("count"))
         for _ in range(count):
             self.readInterruptedTask(db)
 
     def readInterruptedTask(self, db: MooDatabase) -> None:
-        header = self.readString()
-        headerMatch = interruptedTaskHeaderRe.match(header)
-        if not headerMatch:
+        task_id, _, status = self.readString().partition(" ")
+        if not task_id.isdecimal() or not status:
             self.parse_error("Bad interrupted tasks header")
-        task_id = headerMatch.group("id")
         vm = self.readVM(db)
         # Shrug
         return None
@@ -586,11 +632,7 @@ class Reader:
             local = self.readValue(db)
         else:
             local = {}
-        header = self.readString()
-        headerMatch = vmHeaderRe.match(header)
-        if not headerMatch:
-            self.parse_error(f"Bad VM Header {header}")
-        top = int(headerMatch.group("top"))
+        top, _vector, _funcId, _maxStackframes = self.readIntFields(4, "Bad VM Header")
         stack = []
         for _ in range(top + 1):
             stack.append(self.read_activation(db))